@@ -1,41 +1,93 @@
-import React, { useState, useEffect } from 'react';
-import { Plus, Sparkles, X, Loader2 } from 'lucide-react';
+import React, { useState, useEffect, useCallback, useDeferredValue, useMemo, memo } from 'react';
+import { Plus, Sparkles } from 'lucide-react';
 import EventCard from './components/EventCard'; // Import the component
+import EventForm from './components/EventForm';
+
+// Compiled once at module load; strips ```json and ``` fences in a single pass
+const FENCE_RE = /```(?:json)?/g;
+
+// Shared by the initial load and the persistence effect
+const STORAGE_KEY = 'ai_events_v1';
+
+// How many events are rendered initially and per "older events" click
+const PAGE_SIZE = 50;
+
+// Gemini is called through the Flask proxy in app.py, which holds the API key
+const callGeminiAPI = async (prompt, onDelta, signal) => {
+  const response = await fetch('/generate-plan', {
+    method: 'POST',
+    signal,
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ prompt }),
+  });
 
-const apiKey = "YOUR_API_KEY_HERE"; // Replace with your actual Gemini API Key
+  if (!response.ok) throw new Error('Failed to generate plan');
+
+  // The proxy streams plain text chunks as the model produces them
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let textResponse = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    const text = decoder.decode(value, { stream: true });
+    if (!text) continue;
+    textResponse += text;
+    if (onDelta) onDelta(text);
+  }
+  textResponse += decoder.decode();
+
+  // Most responses are raw JSON as requested, so only run the regex when a fence is present
+  const cleanJson = (textResponse.includes('`') ? textResponse.replace(FENCE_RE, '') : textResponse).trim();
+  return JSON.parse(cleanJson);
+};
+
+const EventGrid = memo(function EventGrid({ events, onDelete }) {
+  return (
+    <div className="grid grid-cols-1 gap-8">
+      {events.map((event) => (
+        <EventCard key={event.id} event={event} onDelete={onDelete} />
+      ))}
+    </div>
+  );
+});
 
 export default function App() {
   const [events, setEvents] = useState(() => {
-    const saved = localStorage.getItem('ai_events_v1');
+    const saved = localStorage.getItem(STORAGE_KEY);
     return saved ? JSON.parse(saved) : [];
   });
+  // Re-rendering a long list after an add/delete yields to urgent updates such as
+  // streamed progress and the loading/modal toggles
+  const deferredEvents = useDeferredValue(events);
+  const isStale = deferredEvents !== events;
+  const [visibleCount, setVisibleCount] = useState(PAGE_SIZE);
+  // Memoized so EventGrid keeps the same array while unrelated state changes
+  const visibleEvents = useMemo(
+    () => deferredEvents.slice(0, visibleCount),
+    [deferredEvents, visibleCount]
+  );
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState(null);
-
-  const [formData, setFormData] = useState({
-    name: '',
-    age: '',
-    gender: 'Any',
-    eventType: ''
-  });
+  const [streamedChars, setStreamedChars] = useState(0);
 
   useEffect(() => {
-    localStorage.setItem('ai_events_v1', JSON.stringify(events));
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(events));
   }, [events]);
 
-  const handleInputChange = (e) => {
-    setFormData({ ...formData, [e.target.name]: e.target.value });
-  };
-
-  const generateEventPlan = async () => {
+  const generateEventPlan = async (formData) => {
     if (!formData.name || !formData.age || !formData.eventType) {
       setError("Please fill in all required fields.");
-      return;
+      return false;
     }
 
     setIsLoading(true);
     setError(null);
+    setStreamedChars(0);
 
     const prompt = `
       Act as an expert event planner. Plan an event with the following details:
@@ -57,48 +109,60 @@ export default function App() {
       Return ONLY the raw JSON string. Do not use Markdown formatting.
     `;
 
+    // One controller per attempt; aborting it ends the stream and silences late progress updates
+    const controller = new AbortController();
+    // Streamed progress is committed at most once per animation frame
+    let pendingChars = 0;
+    let frame = null;
+    const flushProgress = () => {
+      frame = null;
+      if (controller.signal.aborted) return;
+      const n = pendingChars;
+      pendingChars = 0;
+      setStreamedChars(c => c + n);
+    };
+    const onDelta = (text) => {
+      if (controller.signal.aborted) return;
+      pendingChars += text.length;
+      if (frame === null) frame = requestAnimationFrame(flushProgress);
+    };
+
     try {
-      const response = await fetch(
-        `https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-09-2025:generateContent?key=${apiKey}`,
-        {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            contents: [{ parts: [{ text: prompt }] }],
-          }),
-        }
-      );
-
-      if (!response.ok) throw new Error('Failed to generate plan');
-
-      const data = await response.json();
-      const textResponse = data.candidates[0].content.parts[0].text;
-      const cleanJson = textResponse.replace(/```json/g, '').replace(/```/g, '').trim();
-      const aiData = JSON.parse(cleanJson);
+      const aiData = await callGeminiAPI(prompt, onDelta, controller.signal);
+      if (frame !== null) {
+        cancelAnimationFrame(frame);
+        flushProgress();
+      }
 
+      // Read the clock once for both the id and the display date
+      const now = new Date();
       const newEvent = {
-        id: Date.now(),
+        id: now.getTime(),
         ...formData,
         ...aiData,
-        createdAt: new Date().toLocaleDateString()
+        createdAt: now.toLocaleDateString()
       };
 
-      setEvents([newEvent, ...events]);
+      // Functional update so a delete made while generating isn't overwritten by a stale list
+      setEvents(prev => [newEvent, ...prev]);
       setIsModalOpen(false);
-      setFormData({ name: '', age: '', gender: 'Any', eventType: '' });
+      return true;
     } catch (err) {
       console.error(err);
       setError("Oops! The AI had a hiccup. Please try again.");
+      return false;
     } finally {
+      controller.abort();
+      if (frame !== null) cancelAnimationFrame(frame);
       setIsLoading(false);
     }
   };
 
-  const deleteEvent = (id) => {
-    setEvents(events.filter(e => e.id !== id));
-  };
+  // Stable reference so memoized EventCards skip App re-renders from streamed progress
+  // and the loading/modal toggles
+  const deleteEvent = useCallback((id) => {
+    setEvents(prev => prev.filter(e => e.id !== id));
+  }, []);
 
   return (
     <div className="min-h-screen bg-slate-50 text-slate-900 font-sans selection:bg-purple-200">
@@ -134,109 +198,28 @@ export default function App() {
           </div>
         )}
 
-        <div className="grid grid-cols-1 gap-8">
-          {events.map((event) => (
-            <EventCard key={event.id} event={event} onDelete={deleteEvent} />
-          ))}
+        <div className={`transition-opacity ${isStale ? 'opacity-70' : ''}`}>
+          <EventGrid events={visibleEvents} onDelete={deleteEvent} />
         </div>
+
+        {deferredEvents.length > visibleCount && (
+          <button
+            onClick={() => setVisibleCount(c => c + PAGE_SIZE)}
+            className="w-full mt-8 py-3 text-slate-500 hover:text-violet-600 font-medium transition-colors"
+          >
+            Show older events ({deferredEvents.length - visibleCount} more)
+          </button>
+        )}
       </div>
 
-      {isModalOpen && (
-        <div className="fixed inset-0 z-50 flex items-center justify-center p-4 bg-slate-900/60 backdrop-blur-sm transition-opacity">
-          <div className="bg-white rounded-2xl shadow-2xl w-full max-w-md overflow-hidden relative animate-in fade-in zoom-in duration-300">
-            <div className="bg-gradient-to-r from-violet-600 to-indigo-600 p-6 text-white">
-              <div className="flex justify-between items-center">
-                <h2 className="text-2xl font-bold flex items-center gap-2">
-                  <Sparkles className="w-5 h-5" />
-                  Plan an Event
-                </h2>
-                <button onClick={() => setIsModalOpen(false)} className="hover:bg-white/20 p-1 rounded-full transition-colors">
-                  <X className="w-6 h-6" />
-                </button>
-              </div>
-              <p className="text-indigo-100 mt-1 text-sm">Tell us a little bit, we'll do the rest.</p>
-            </div>
-
-            <div className="p-6 space-y-4">
-              {error && (
-                <div className="bg-red-50 text-red-600 p-3 rounded-lg text-sm font-medium">
-                  {error}
-                </div>
-              )}
-
-              <div>
-                <label className="block text-sm font-medium text-slate-700 mb-1">Event Name / Occasion</label>
-                <input
-                  type="text"
-                  name="eventType"
-                  placeholder="e.g. Birthday, Anniversary, Graduation"
-                  value={formData.eventType}
-                  onChange={handleInputChange}
-                  className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none"
-                />
-              </div>
-
-              <div>
-                <label className="block text-sm font-medium text-slate-700 mb-1">Who is it for?</label>
-                <input
-                  type="text"
-                  name="name"
-                  placeholder="Person's Name"
-                  value={formData.name}
-                  onChange={handleInputChange}
-                  className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none"
-                />
-              </div>
-
-              <div className="flex gap-4">
-                <div className="flex-1">
-                  <label className="block text-sm font-medium text-slate-700 mb-1">Age</label>
-                  <input
-                    type="number"
-                    name="age"
-                    placeholder="25"
-                    value={formData.age}
-                    onChange={handleInputChange}
-                    className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none"
-                  />
-                </div>
-                <div className="flex-1">
-                  <label className="block text-sm font-medium text-slate-700 mb-1">Gender</label>
-                  <select
-                    name="gender"
-                    value={formData.gender}
-                    onChange={handleInputChange}
-                    className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none bg-white"
-                  >
-                    <option value="Any">Any</option>
-                    <option value="Male">Male</option>
-                    <option value="Female">Female</option>
-                    <option value="Non-binary">Non-binary</option>
-                  </select>
-                </div>
-              </div>
-
-              <button
-                onClick={generateEventPlan}
-                disabled={isLoading}
-                className="w-full mt-4 bg-gradient-to-r from-fuchsia-600 to-pink-600 hover:from-fuchsia-700 hover:to-pink-700 text-white font-bold py-3 rounded-xl shadow-md hover:shadow-lg transition-all flex items-center justify-center gap-2 disabled:opacity-70 disabled:cursor-not-allowed"
-              >
-                {isLoading ? (
-                  <>
-                    <Loader2 className="w-5 h-5 animate-spin" />
-                    Consulting AI...
-                  </>
-                ) : (
-                  <>
-                    <Sparkles className="w-5 h-5" />
-                    Generate Magic Plan
-                  </>
-                )}
-              </button>
-            </div>
-          </div>
-        </div>
-      )}
+      <EventForm
+        isOpen={isModalOpen}
+        onSubmit={generateEventPlan}
+        onClose={() => setIsModalOpen(false)}
+        isLoading={isLoading}
+        streamedChars={streamedChars}
+        error={error}
+      />
     </div>
   );
 }
@@ -1,11 +1,11 @@
-import React, { useState } from 'react';
+import React, { useState, memo } from 'react';
 import { Trash2, Gift, CheckSquare, User, PartyPopper, ChevronDown, ChevronUp } from 'lucide-react';
 
-export default function EventCard({ event, onDelete }) {
+function EventCard({ event, onDelete }) {
   const [expanded, setExpanded] = useState(false);
 
   return (
-    <div className="bg-white rounded-2xl shadow-xl border border-slate-100 overflow-hidden hover:shadow-2xl transition-shadow duration-300">
+    <div className="card-offscreen-skip bg-white rounded-2xl shadow-xl border border-slate-100 overflow-hidden hover:shadow-2xl transition-shadow duration-300">
       <div className="p-6 md:p-8">
         {/* Card Header */}
         <div className="flex justify-between items-start mb-6">
@@ -110,3 +110,5 @@ export default function EventCard({ event, onDelete }) {
     </div>
   );
 }
+
+export default memo(EventCard);
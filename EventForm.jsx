@@ -0,0 +1,123 @@
+import React, { useState } from 'react';
+import { Sparkles, X, Loader2 } from 'lucide-react';
+
+const emptyForm = {
+  name: '',
+  age: '',
+  gender: 'Any',
+  eventType: ''
+};
+
+export default function EventForm({ isOpen, onSubmit, onClose, isLoading, streamedChars, error }) {
+  // Form state lives here so keystrokes only re-render this component, not the event list.
+  // The component stays mounted while closed, so closing the modal keeps what was typed.
+  const [formData, setFormData] = useState(emptyForm);
+
+  const handleInputChange = (e) => {
+    setFormData({ ...formData, [e.target.name]: e.target.value });
+  };
+
+  const handleSubmit = async () => {
+    const created = await onSubmit(formData);
+    if (created) setFormData(emptyForm);
+  };
+
+  if (!isOpen) return null;
+
+  return (
+    <div className="fixed inset-0 z-50 flex items-center justify-center p-4 bg-slate-900/60 backdrop-blur-sm transition-opacity">
+      <div className="bg-white rounded-2xl shadow-2xl w-full max-w-md overflow-hidden relative animate-in fade-in zoom-in duration-300">
+        <div className="bg-gradient-to-r from-violet-600 to-indigo-600 p-6 text-white">
+          <div className="flex justify-between items-center">
+            <h2 className="text-2xl font-bold flex items-center gap-2">
+              <Sparkles className="w-5 h-5" />
+              Plan an Event
+            </h2>
+            <button onClick={onClose} className="hover:bg-white/20 p-1 rounded-full transition-colors">
+              <X className="w-6 h-6" />
+            </button>
+          </div>
+          <p className="text-indigo-100 mt-1 text-sm">Tell us a little bit, we'll do the rest.</p>
+        </div>
+
+        <div className="p-6 space-y-4">
+          {error && (
+            <div className="bg-red-50 text-red-600 p-3 rounded-lg text-sm font-medium">
+              {error}
+            </div>
+          )}
+
+          <div>
+            <label className="block text-sm font-medium text-slate-700 mb-1">Event Name / Occasion</label>
+            <input
+              type="text"
+              name="eventType"
+              placeholder="e.g. Birthday, Anniversary, Graduation"
+              value={formData.eventType}
+              onChange={handleInputChange}
+              className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none"
+            />
+          </div>
+
+          <div>
+            <label className="block text-sm font-medium text-slate-700 mb-1">Who is it for?</label>
+            <input
+              type="text"
+              name="name"
+              placeholder="Person's Name"
+              value={formData.name}
+              onChange={handleInputChange}
+              className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none"
+            />
+          </div>
+
+          <div className="flex gap-4">
+            <div className="flex-1">
+              <label className="block text-sm font-medium text-slate-700 mb-1">Age</label>
+              <input
+                type="number"
+                name="age"
+                placeholder="25"
+                value={formData.age}
+                onChange={handleInputChange}
+                className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none"
+              />
+            </div>
+            <div className="flex-1">
+              <label className="block text-sm font-medium text-slate-700 mb-1">Gender</label>
+              <select
+                name="gender"
+                value={formData.gender}
+                onChange={handleInputChange}
+                className="w-full px-4 py-2 rounded-lg border border-slate-200 focus:border-violet-500 focus:ring-2 focus:ring-violet-200 transition-all outline-none bg-white"
+              >
+                <option value="Any">Any</option>
+                <option value="Male">Male</option>
+                <option value="Female">Female</option>
+                <option value="Non-binary">Non-binary</option>
+              </select>
+            </div>
+          </div>
+
+          <button
+            onClick={handleSubmit}
+            disabled={isLoading}
+            className="w-full mt-4 bg-gradient-to-r from-fuchsia-600 to-pink-600 hover:from-fuchsia-700 hover:to-pink-700 text-white font-bold py-3 rounded-xl shadow-md hover:shadow-lg transition-all flex items-center justify-center gap-2 disabled:opacity-70 disabled:cursor-not-allowed"
+          >
+            {isLoading ? (
+              <>
+                <Loader2 className="w-5 h-5 animate-spin" />
+                Consulting AI...{streamedChars > 0 && ` (${streamedChars} chars)`}
+              </>
+            ) : (
+              <>
+                <Sparkles className="w-5 h-5" />
+                Generate Magic Plan
+              </>
+            )}
+          </button>
+        </div>
+      </div>
+    </div>
+  );
+}
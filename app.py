@@ -1,15 +1,48 @@
-from flask import Flask, request, jsonify
+from itertools import chain
+
+from flask import Flask, request, jsonify, Response, stream_with_context
 import google.generativeai as genai
 
+# The React client posts to the relative path /generate-plan. In development, run
+# this server (`python app.py`, port 5000) and proxy that path from the Vite dev server:
+#   server: { proxy: { '/generate-plan': 'http://127.0.0.1:5000' } }
+# In production, serve the built frontend and this API from the same origin.
+
 app = Flask(__name__)
 genai.configure(api_key="YOUR_API_KEY")
+# Created once so every request shares the same client and its connection pool
+model = genai.GenerativeModel('gemini-2.5-flash-preview-09-2025')
+
+def has_text(chunk):
+    # chunk.parts raises ValueError when there are no candidates (blocked prompts,
+    # trailing usage-only chunks), so check the candidates directly
+    return bool(chunk.candidates and chunk.candidates[0].content.parts)
 
 @app.route('/generate-plan', methods=['POST'])
 def generate_plan():
-    data = request.json
-    model = genai.GenerativeModel('gemini-2.5-flash-preview-09-2025')
-    # ... logic to call model ...
-    return jsonify(response.text)
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get('prompt'), str) or not data['prompt']:
+        return jsonify({"error": "Expected a JSON object with a non-empty 'prompt' string"}), 400
+
+    # Start the call and read the first chunk before committing to a 200, so bad keys,
+    # quota errors and blocked prompts reach the client as an error status instead of
+    # an empty or truncated body
+    try:
+        stream = iter(model.generate_content(data['prompt'], stream=True))
+        first = next(stream, None)
+    except Exception:
+        app.logger.exception("Gemini request failed")
+        return jsonify({"error": "Upstream model error"}), 502
+    if first is None or not has_text(first):
+        return jsonify({"error": "The model returned no content"}), 502
+
+    def generate():
+        for chunk in chain([first], stream):
+            # Later chunks may only carry a finish reason or usage and no text
+            if has_text(chunk):
+                yield chunk.text
+
+    return Response(stream_with_context(generate()), mimetype='text/plain')
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file